@@ -49,6 +49,10 @@ class DefaultConfig:
     LOG_TO_CONSOLE: bool = True
     LOG_TO_FILE: bool = True
     LOG_STRUCTURED_JSON: bool = False
+    # Opt-in: format + write log records on a background QueueListener
+    # thread so request handlers only pay for an enqueue.  Log lines are
+    # then no longer ordered with direct stdout/stderr writes.
+    LOG_QUEUE_HANDLER: bool = False
 
     # ── A2A Server ────────────────────────────────────────────────────────
     A2A_SERVER_HOST: str = "localhost"
@@ -64,6 +68,28 @@ class DefaultConfig:
     SUPERVISOR_SUMMARIZATION_TRIGGER_TOKENS: int = 4000
     SUPERVISOR_SUMMARIZATION_KEEP_MESSAGES: int = 6
     SUPERVISOR_MODEL_CALL_LIMIT: int = 15
+    # When the supervisor graph writes checkpoints:
+    #   "node"  — after every supervisor step (LangGraph default).
+    #   "phase" — opt-in; only when a run exits (completion, HITL interrupt,
+    #             error).  Fewer writes, but a crash or cancelled run loses
+    #             all progress since the last exit.
+    SUPERVISOR_CHECKPOINT_MODE: str = "node"
+    # Seconds server startup waits for coordinator graphs to pre-build.
+    # Builds still running when it expires (e.g. a hanging MCP server)
+    # finish in the background; requests join the in-flight build.
+    SUPERVISOR_PREBUILD_TIMEOUT: float = 60.0
+
+    # ── HITL Checkpointer (PostgreSQL) ───────────────────────────────────
+    # Async connection pool behind the PostgreSQL checkpointer (used when
+    # DATABASE_URI / POSTGRES_URI is set).  The saver serializes checkpoint
+    # operations, so it never uses more than one connection at a time.
+    HITL_PG_POOL_MIN_SIZE: int = 1
+    HITL_PG_POOL_MAX_SIZE: int = 2
+    # Opt-in: run checkpoint sessions with ``synchronous_commit = off`` so
+    # commits skip the per-write WAL fsync wait.  A crash may drop the last
+    # few hundred ms of checkpoints (never corrupts them), so leave it off
+    # where checkpoints must be durable (production).
+    HITL_PG_ASYNC_COMMIT: bool = False
 
     # ── MCP Servers ─────────────────────────────────────────────────────────
     # Default transport is **stdio** for all TalkOps MCP servers (PyPI
@@ -70,6 +70,9 @@ from k8s_autopilot.utils.logger import AgentLogger
 
 logger = AgentLogger("A2AExecutor")
 
+# Opening/closing character pairs of a serialized JSON object or array.
+_JSON_BRACKETS = frozenset({("{", "}"), ("[", "]")})
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -132,12 +135,12 @@ class _StreamRenderer:
             await self.emit(f"\n\n**{agent}**\n\n")
 
         content = str(text) if text else ""
-        # Suppress raw JSON blobs leaking into the AI text stream.
-        stripped = content.strip()
-        if len(stripped) > 300 and stripped.startswith("{") and stripped.endswith("}"):
-            return
-        if len(stripped) > 300 and stripped.startswith("[") and stripped.endswith("]"):
-            return
+        # Suppress raw JSON blobs leaking into the AI text stream.  Only
+        # long chunks can qualify, so short tokens skip the stripped copy.
+        if len(content) > 300:
+            stripped = content.strip()
+            if len(stripped) > 300 and (stripped[0], stripped[-1]) in _JSON_BRACKETS:
+                return
 
         await self.emit(content)
 
@@ -250,9 +253,9 @@ class A2AAutoPilotExecutor(AgentExecutor):
 
     def _try_activate_a2ui(self, context: RequestContext) -> bool:
         """Check whether A2UI should be activated for this request."""
-        if hasattr(context, "extensions") and context.extensions:  # type: ignore[attr-defined]
-            if A2UI_EXTENSION_URI in context.extensions:  # type: ignore[attr-defined]
-                return True
+        extensions = getattr(context, "extensions", None)
+        if extensions and A2UI_EXTENSION_URI in extensions:
+            return True
         # Always activate A2UI natively in autopilot Dev-Loop execution
         return True
 
@@ -264,7 +267,9 @@ class A2AAutoPilotExecutor(AgentExecutor):
         """
         query = context.get_user_input()
         if query:
-            logger.debug(f"User query: {query[:120]}", extra={"agent_name": self.agent.name},)
+            # %.120s truncates lazily — nothing is sliced or formatted
+            # unless DEBUG is enabled.
+            logger.debug("User query: %.120s", query, extra={"agent_name": self.agent.name})
             return query
 
         # Try A2UI userAction
@@ -388,10 +393,13 @@ class A2AAutoPilotExecutor(AgentExecutor):
     @staticmethod
     def _wrap_resume(task: Task, query: Any) -> Union[str, Command, None]:
         """Wrap ``query`` in ``Command(resume=...)`` if the task is paused."""
-        if not (task and hasattr(task, "status") and hasattr(task.status, "state")):
+        # One getattr chain instead of hasattr probes + re-reads; a missing
+        # task/status/state all collapse to None.
+        state = getattr(getattr(task, "status", None), "state", None) if task else None
+        if state is None:
             return query
 
-        if task.status.state == TaskState.TASK_STATE_INPUT_REQUIRED:
+        if state == TaskState.TASK_STATE_INPUT_REQUIRED:
             logger.info("Resuming from input_required — wrapping as Command(resume=...)",
                 extra={
                     "task_id": task.id,
@@ -873,7 +881,7 @@ class A2AAutoPilotExecutor(AgentExecutor):
                 )
             else:
                 content = item.content or "Task completed successfully."
-                if isinstance(content, str) and not content.strip():
+                if isinstance(content, str) and content.isspace():
                     content = "Task completed successfully."
 
                 parts = self._build_a2ui_parts(
@@ -1062,7 +1070,8 @@ class A2AAutoPilotExecutor(AgentExecutor):
             "traceStepIndex": step_index,
             "agentName": self.agent.name,
             "eventType": event_type,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # Millisecond precision matches what the UI's Date parsing keeps.
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
         })
 
     @staticmethod
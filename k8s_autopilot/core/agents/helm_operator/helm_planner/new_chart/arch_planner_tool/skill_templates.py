@@ -442,24 +442,27 @@ def render_execution_blueprint(
     arch_pattern = k8s_res.get("architecture_pattern", "N/A")
     complexity = k8s_res.get("estimated_complexity", "N/A")
 
-    bp = f"# {app_name.upper()} — Execution Blueprint\n\n"
-    bp += f"**Architecture Pattern**: `{arch_pattern}`\n"
-    bp += f"**Estimated Complexity**: `{complexity}`\n\n"
-    bp += "---\n\n"
+    # Collect fragments and join once; repeated ``+=`` on the growing
+    # blueprint string re-copies it for every table row.
+    parts: List[str] = [f"# {app_name.upper()} — Execution Blueprint\n\n"]
+    add = parts.append
+    add(f"**Architecture Pattern**: `{arch_pattern}`\n")
+    add(f"**Estimated Complexity**: `{complexity}`\n\n")
+    add("---\n\n")
 
     # ── Core Resources ──
-    bp += "## Core Resources\n\n"
+    add("## Core Resources\n\n")
     if not core_resources:
-        bp += "> No core resources defined.\n\n"
+        add("> No core resources defined.\n\n")
     for cr in core_resources:
         rtype = cr.get("type", "Unknown")
-        bp += f"### {rtype}\n\n"
+        add(f"### {rtype}\n\n")
 
         # Key configuration parameters
         kcp = cr.get("key_configuration_parameters", {})
         if kcp:
-            bp += "**Key Configuration Parameters:**\n\n"
-            bp += "| Parameter | Value |\n|---|---|\n"
+            add("**Key Configuration Parameters:**\n\n")
+            add("| Parameter | Value |\n|---|---|\n")
             for key, val in kcp.items():
                 if isinstance(val, dict):
                     val_str = ", ".join(f"`{k}: {v}`" for k, v in val.items())
@@ -467,21 +470,21 @@ def render_execution_blueprint(
                     val_str = ", ".join(f"`{v}`" for v in val)
                 else:
                     val_str = f"`{val}`"
-                bp += f"| {key} | {val_str} |\n"
-            bp += "\n"
+                add(f"| {key} | {val_str} |\n")
+            add("\n")
 
         # Alternatives considered
         alts = cr.get("alternatives_considered", [])
         if alts:
-            bp += "**Alternatives Considered:**\n\n"
+            add("**Alternatives Considered:**\n\n")
             for alt in alts:
-                bp += f"- {alt}\n"
-            bp += "\n"
+                add(f"- {alt}\n")
+            add("\n")
 
     # ── Auxiliary Resources ──
-    bp += "---\n\n## Auxiliary Resources\n\n"
+    add("---\n\n## Auxiliary Resources\n\n")
     if not aux_resources:
-        bp += "> No auxiliary resources defined.\n\n"
+        add("> No auxiliary resources defined.\n\n")
 
     for ar in aux_resources:
         rtype = ar.get("type", "Unknown")
@@ -491,18 +494,18 @@ def render_execution_blueprint(
         tradeoffs = ar.get("tradeoffs", "")
         hints = ar.get("configuration_hints", {})
 
-        bp += f"### {rtype}\n\n"
-        bp += f"- **Criticality**: `{criticality}`\n"
+        add(f"### {rtype}\n\n")
+        add(f"- **Criticality**: `{criticality}`\n")
         if env_specific:
-            bp += f"- **Environment**: `{env_specific}` only\n"
+            add(f"- **Environment**: `{env_specific}` only\n")
         if deps:
-            bp += f"- **Depends On**: {', '.join(f'`{d}`' for d in deps)}\n"
-        bp += "\n"
+            add(f"- **Depends On**: {', '.join(f'`{d}`' for d in deps)}\n")
+        add("\n")
 
         # Configuration hints
         if hints:
-            bp += "**Configuration:**\n\n"
-            bp += "| Parameter | Value |\n|---|---|\n"
+            add("**Configuration:**\n\n")
+            add("| Parameter | Value |\n|---|---|\n")
             for key, val in hints.items():
                 if key == "justification":
                     continue  # shown separately
@@ -514,19 +517,19 @@ def render_execution_blueprint(
                     val_str = "Yes" if val else "No"
                 else:
                     val_str = f"`{val}`"
-                bp += f"| {key} | {val_str} |\n"
-            bp += "\n"
+                add(f"| {key} | {val_str} |\n")
+            add("\n")
 
             # Justification
             justification = hints.get("justification", "")
             if justification:
-                bp += f"> **Rationale**: {justification}\n\n"
+                add(f"> **Rationale**: {justification}\n\n")
 
         # Tradeoffs
         if tradeoffs:
-            bp += f"⚠️ **Tradeoffs**: {tradeoffs}\n\n"
+            add(f"⚠️ **Tradeoffs**: {tradeoffs}\n\n")
 
-    return bp
+    return "".join(parts)
 
 
 # ===========================================================================
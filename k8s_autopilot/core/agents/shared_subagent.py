@@ -36,12 +36,19 @@ API References:
       https://docs.langchain.com/oss/python/deepagents/customization#default-stack-main-agent
 """
 
+import re
 from typing import Any, Callable, Dict, List, Optional
 
 from k8s_autopilot.utils.logger import AgentLogger
 
 _logger = AgentLogger("SharedSubagentFactory")
 
+# Error-text markers that indicate an expired / rejected MCP credential.
+_AUTH_ERROR_RE = re.compile(
+    r"authentication failed|401|403|unauthorized|forbidden|expired",
+    re.IGNORECASE,
+)
+
 # ---------------------------------------------------------------------------
 # Subagent loop-prevention limits (configurable via environment variables)
 #
@@ -312,10 +319,7 @@ def build_mcp_subagent(
                 extra={"error": err_str, "servers": server_filter},
             )
 
-            if any(kw in err_str.lower() for kw in (
-                "authentication failed", "401", "403",
-                "unauthorized", "forbidden", "expired",
-            )):
+            if _AUTH_ERROR_RE.search(err_str):
                 error_msg = (
                     f"FAILED: {name} could not connect to the MCP server "
                     f"({', '.join(server_filter)}). The authentication token "
@@ -1,19 +1,26 @@
 """K8s Autopilot Supervisor Agent — pure router delegating to coordinators."""
 
 import asyncio
+import functools
 import json
+import logging
 import re
-from collections.abc import AsyncGenerator
+import traceback
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
 from typing import Any, cast, Literal
 from pydantic import BaseModel, Field
-from langchain.tools import tool
-from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
+try:
+    from langchain_core.tracers.langchain import wait_for_all_tracers
+except ImportError:  # pragma: no cover — tracer flush is best-effort
+    wait_for_all_tracers = None  # type: ignore[assignment]
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.errors import GraphInterrupt
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.state import CompiledStateGraph
-from langgraph.types import Command, StreamMode, StreamWriter, interrupt
+from langgraph.types import Command, Durability, StreamMode, StreamWriter, interrupt
 
 from k8s_autopilot.config.config import Config
 from k8s_autopilot.core.state.base import (
@@ -21,6 +28,8 @@ from k8s_autopilot.core.state.base import (
     SupervisorWorkflowState,
 )
 from k8s_autopilot.core.state.handoff_contracts import (
+    HandoffResult,
+    _extract_clean_text,
     check_loop_guard,
     increment_loop_guard,
     format_handoff_for_context,
@@ -101,6 +110,10 @@ Do not output natural language outside of the schema.
 </output_contract>
 """
 
+# The default router prompt has no runtime substitutions, so its
+# SystemMessage is built once at import and shared by every supervisor.
+_DEFAULT_SYSTEM_MESSAGE = SystemMessage(content=SUPERVISOR_PROMPT)
+
 
 # ---------------------------------------------------------------------------
 # Cross-domain handoff logic has moved to core/state/handoff_contracts.py
@@ -138,6 +151,17 @@ def _extract_content_text(content: Any) -> str:
     return str(content) if content else ""
 
 
+def _ns_source(ns: Any) -> str:
+    """Node name from a stream namespace, or ``""`` at the top level.
+
+    ``()`` → supervisor level; ``("helm_agent:<run_id>", ...)`` →
+    ``"helm_agent"`` (first segment, run id stripped).
+    """
+    if not ns or not isinstance(ns, (list, tuple)):
+        return ""
+    return str(ns[0]).partition(":")[0]
+
+
 def _extract_reasoning_text(msg_chunk: Any) -> str:
     """Extract reasoning/thinking from an AIMessageChunk (provider-agnostic).
 
@@ -168,8 +192,13 @@ def _extract_reasoning_text(msg_chunk: Any) -> str:
     return "".join(parts)
 
 
+@functools.lru_cache(maxsize=256)
 def _humanize_tool_name(raw_name: str) -> str:
-    """Convert snake_case tool name to Title Case display name."""
+    """Convert snake_case tool name to Title Case display name.
+
+    Memoised: the tool/agent name set is small and every streamed tool
+    call, result and delegation label re-renders the same names.
+    """
     if not raw_name:
         return "Tool"
 
@@ -290,6 +319,15 @@ _COORDINATOR_SPECS: list[tuple[str, str, str, str, str]] = [
     ),
 ]
 
+# SUPERVISOR_CHECKPOINT_MODE → LangGraph durability.  "node" (default)
+# persists after every router/coordinator step.  "phase" is opt-in and
+# persists only when a run exits (completion / interrupt / error); a crash
+# or cancellation mid-turn loses everything since the last exit.
+_CHECKPOINT_DURABILITY: dict[str, Durability] = {
+    "phase": "exit",
+    "node": "async",
+}
+
 # Node name mapping: tool names <-> StateGraph node names (architecture spec)
 _TOOL_TO_NODE: dict[str, str] = {
     "transfer_to_helm_operator": "helm_agent",
@@ -299,6 +337,22 @@ _TOOL_TO_NODE: dict[str, str] = {
 }
 # Mapping logic remains. Handoff target keywords moved to handoff_contracts.py.
 
+# Parent RunnableConfig keys that must not leak into a coordinator's deep
+# agent run (it has its own store and the parent callbacks break streaming).
+_CHILD_CONFIG_EXCLUDED_KEYS: frozenset[str] = frozenset({"store", "callbacks"})
+_COORDINATOR_RECURSION_LIMIT = 250
+
+
+def _append_resume_message(msgs: list[Any], resume_str: str) -> list[Any]:
+    """Append the user's interrupt reply to ``msgs`` unless it is empty.
+
+    An empty reply carries nothing for the router, and some providers
+    reject blank HumanMessages in the history.
+    """
+    if resume_str:
+        msgs.append(HumanMessage(content=resume_str))
+    return msgs
+
 
 def _extract_tc_fields(tc: Any) -> tuple[str, dict[str, Any] | None]:
     """Extract name and args from a tool call (dict or object)."""
@@ -307,6 +361,15 @@ def _extract_tc_fields(tc: Any) -> tuple[str, dict[str, Any] | None]:
     return getattr(tc, "name", ""), getattr(tc, "args", None)
 
 
+async def _ensure_coordinator_graph(
+    coordinator: BaseDeepAgent, node_name: str,
+) -> CompiledStateGraph | None:
+    """Build the coordinator's deep agent graph on first use and return it."""
+    if not coordinator.is_initialized:
+        logger.info("Building %s deep agent graph", node_name)
+    return await coordinator.ensure_graph()
+
+
 # ---------------------------------------------------------------------------
 # SupervisorAgent
 # ---------------------------------------------------------------------------
@@ -345,6 +408,9 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             self.memory = MemorySaver()
 
         self.model = create_model(self.config_instance.get_llm_config())
+        # Structured-output router runnable, bound on first classification
+        # and reused for the lifetime of this supervisor.
+        self._router_model: Any = None
 
         # Coordinator(s) — multi-coordinator is preferred
         self.agents: dict[str, Any] = {}
@@ -358,13 +424,31 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             self._coordinator = coordinator
             self.agents[coordinator.name] = coordinator
         else:
+            # BaseSubgraphAgent always exposes a ``memory`` setter.
             for agent in (agents or []):
-                if hasattr(agent, "memory"):
-                    agent.memory = self.memory
+                agent.memory = self.memory
                 self.agents[agent.name] = agent
 
+        # Snapshot of registered agent names — rebuilt only when the
+        # registry changes so list_agents() stays O(1) for health probes.
+        self._agents_tuple: tuple[str, ...] = tuple(self.agents)
+
+        checkpoint_mode = str(self.config_instance.get("SUPERVISOR_CHECKPOINT_MODE", "node")).lower()
+        # Resolved once; every stream() call reuses it for the run config.
+        self._recursion_limit = int(getattr(self.config_instance, "recursion_limit", 50))
+        self._durability: Durability = _CHECKPOINT_DURABILITY.get(checkpoint_mode, "async")
+
         self.prompt_template = prompt_template or SUPERVISOR_PROMPT
+        # The router prompt is static per instance — build its message once
+        # instead of re-validating a SystemMessage on every classification.
+        self._system_message = (
+            _DEFAULT_SYSTEM_MESSAGE
+            if self.prompt_template is SUPERVISOR_PROMPT
+            else SystemMessage(content=self.prompt_template)
+        )
         self._graph = self._build_supervisor_graph()
+        self._ready: bool = False
+        self._recompute_ready()
 
         mode = (
             "coordinators" if coordinators
@@ -372,13 +456,38 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         )
         logger.info(
             "Supervisor agent initialized",
-            extra={"mode": mode, "agent_count": len(self.agents), "agent_names": list(self.agents.keys())},
+            extra={"mode": mode, "agent_count": len(self._agents_tuple), "agent_names": self._agents_tuple},
         )
 
     @property
     def name(self) -> str:
         return self._name
 
+    async def initialize(self) -> None:
+        """Pre-build every coordinator's deep agent graph concurrently.
+
+        Coordinator graphs are independent, so their ``build_agent()``
+        calls (MCP tool discovery, sub-agent specs) run under a single
+        ``asyncio.gather`` instead of serially on each coordinator's first
+        request.  A coordinator that fails here is left uninitialised and
+        retried lazily by its node.
+        """
+        coords = {id(c): c for c in self.agents.values() if isinstance(c, BaseDeepAgent)}
+        if self._coordinator is not None:
+            coords.setdefault(id(self._coordinator), self._coordinator)
+
+        pending = [c for c in coords.values() if not c.is_initialized]
+        results = await asyncio.gather(
+            *(_ensure_coordinator_graph(c, c.name) for c in pending),
+            return_exceptions=True,
+        )
+        for coord, result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Coordinator pre-build failed — will retry lazily",
+                    extra={"coordinator": coord.name, "error": str(result)},
+                )
+
     # ── Graph builder ─────────────────────────────────────────────────
 
     def _build_supervisor_graph(self) -> CompiledStateGraph:
@@ -430,7 +539,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             )
             available_nodes.append(node_name)
 
-        self._available_coordinator_nodes: set[str] = set(available_nodes)
+        self._available_coordinator_nodes: frozenset[str] = frozenset(available_nodes)
 
         # ── Edges ─────────────────────────────────────────────
         builder.add_edge(START, "supervisor_router")
@@ -489,11 +598,13 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         # ── Process handoff_request → push target onto stack ──────
         handoff_req = state.get("handoff_request")
         if isinstance(handoff_req, dict) and handoff_req.get("target_agent"):
+            req_get = handoff_req.get  # bound once for the reads below
             target = handoff_req["target_agent"]
-            correlation_id = handoff_req.get("correlation_id", "")
+            correlation_id = req_get("correlation_id", "")
+            loop_guard = state.get("loop_guard")
 
             # Loop guard
-            if check_loop_guard(state.get("loop_guard"), correlation_id):
+            if check_loop_guard(loop_guard, correlation_id):
                 logger.warning(
                     "Loop guard triggered — too many handoffs",
                     extra={"correlation_id": correlation_id, "target": target},
@@ -508,18 +619,16 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
 
             updates["dialog_state"] = target  # reducer pushes
             updates["active_agent"] = target
-            updates["return_to"] = handoff_req.get("return_to", "")
-            updates["resume_cursor"] = handoff_req.get("resume_cursor", "")
+            updates["return_to"] = req_get("return_to", "")
+            updates["resume_cursor"] = req_get("resume_cursor", "")
             updates["correlation_id"] = correlation_id
             updates["handoff_request"] = {}  # consumed
-            updates["loop_guard"] = increment_loop_guard(
-                state.get("loop_guard"), correlation_id,
-            )
+            updates["loop_guard"] = increment_loop_guard(loop_guard, correlation_id)
 
             # ── Update user_query so the target coordinator gets
             # the ACTUAL cross-domain request, not the original query.
-            intent = handoff_req.get("intent", "")
-            payload_data = handoff_req.get("payload", {})
+            intent = req_get("intent", "")
+            payload_data = req_get("payload", {})
             user_request = (
                 payload_data.get("user_request", "") if isinstance(payload_data, dict) else ""
             ) or intent
@@ -527,15 +636,16 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 updates["user_query"] = user_request
                 updates["messages"] = [HumanMessage(content=user_request)]
 
-            logger.info(
-                "Stack push (handoff request)",
-                extra={
-                    "target": target,
-                    "return_to": updates["return_to"],
-                    "stack_depth": len(state.get("dialog_state", [])) + 1,
-                    "forwarded_query": user_request[:100] if user_request else "(unchanged)",
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Stack push (handoff request)",
+                    extra={
+                        "target": target,
+                        "return_to": updates["return_to"],
+                        "stack_depth": len(state.get("dialog_state", [])) + 1,
+                        "forwarded_query": user_request[:100] if user_request else "(unchanged)",
+                    },
+                )
             return updates
 
         # ── Process handoff_result → callee already popped itself ─
@@ -550,14 +660,12 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         # handoff intent as user_query, causing an infinite ping-pong.
         handoff_res = state.get("handoff_result")
         if isinstance(handoff_res, dict) and handoff_res.get("correlation_id"):
-            return_to = handoff_res.get("target_agent", "")
-            callee = handoff_res.get("source_agent", "")
-            callee_summary_raw = handoff_res.get("summary", "")
+            res_get = handoff_res.get
+            return_to = res_get("target_agent", "")
+            callee = res_get("source_agent", "")
+            callee_summary_raw = res_get("summary", "")
             # Extract clean user-facing text (strips thinking blocks,
             # signatures, and other internal Gemini content-block metadata).
-            from k8s_autopilot.core.state.handoff_contracts import (  # noqa: PLC0415
-                _extract_clean_text,
-            )
             callee_summary = _extract_clean_text(callee_summary_raw)
 
             summary = format_handoff_for_context(handoff_res)
@@ -567,10 +675,8 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             # than returning the string "pop", because LangGraph may coerce a
             # bare string to list("pop") → ['p','o','p'] before calling the
             # reducer. Returning a list triggers the reducer's overwrite path.
-            current_stack = list(state.get("dialog_state", []))
-            if current_stack:
-                current_stack = current_stack[:-1]
-            updates["dialog_state"] = current_stack
+            stack = state.get("dialog_state", [])
+            updates["dialog_state"] = list(stack[:-1])
             updates["active_agent"] = ""
             updates["status"] = "completed"
 
@@ -589,15 +695,16 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             updates["return_to"] = ""
             updates["resume_cursor"] = ""
             updates["correlation_id"] = ""
-            logger.info(
-                "Handoff result consumed — caller popped (round-trip complete)",
-                extra={
-                    "caller": return_to,
-                    "callee": callee,
-                    "status": handoff_res.get("status"),
-                    "stack_depth": len(state.get("dialog_state", [])),
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Handoff result consumed — caller popped (round-trip complete)",
+                    extra={
+                        "caller": return_to,
+                        "callee": callee,
+                        "status": res_get("status"),
+                        "stack_depth": len(stack),
+                    },
+                )
             return updates
 
         return updates
@@ -623,7 +730,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             if top in self._available_coordinator_nodes:
                 return top
             logger.warning(
-                f"Unknown agent on stack: {top!r} — routing to error_handler",
+                "Unknown agent on stack: %r — routing to error_handler", top,
                 extra={"stack": list(stack)},
             )
             return "error_handler"
@@ -646,8 +753,14 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         extracts the target from the tool call and pushes it onto
         ``dialog_state``.
         """
-        # Bind to structured output
-        model_with_tools = self.model.with_structured_output(RouterDecision, include_raw=True)
+        # Bind to structured output once — the schema and model are fixed
+        # per supervisor, so re-binding every turn only rebuilds the same
+        # tool schema and output parser.
+        model_with_tools = self._router_model
+        if model_with_tools is None:
+            model_with_tools = self._router_model = self.model.with_structured_output(
+                RouterDecision, include_raw=True,
+            )
 
         # Inject cross-domain context (replaces SupervisorContextMiddleware)
         context_msgs: list[Any] = []
@@ -702,7 +815,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         )
 
         messages = [
-            SystemMessage(content=self.prompt_template),
+            self._system_message,
             *context_msgs,
             HumanMessage(content=classification_prompt),
         ]
@@ -713,11 +826,12 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             decision: RouterDecision | None = response_dict.get("parsed")
             raw_msg = response_dict.get("raw")
         except Exception as exc:
-            logger.error("Classification LLM call failed", extra={"error": str(exc)})
+            err_str = str(exc)
+            logger.error("Classification LLM call failed", extra={"error": err_str})
             return {
                 "error_state": {
                     "type": "classification_error",
-                    "message": str(exc),
+                    "message": err_str,
                 },
             }
 
@@ -736,7 +850,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             resume_val = interrupt(payload)
             resume_str = str(resume_val) if resume_val is not None else ""
             msgs = [raw_msg] if raw_msg else []
-            msgs.append(HumanMessage(content=resume_str))
+            _append_resume_message(msgs, resume_str)
             return {
                 "pending_feedback_requests": {},
                 "messages": msgs,
@@ -759,17 +873,18 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             
             return {
                 "pending_feedback_requests": {},
-                "messages": [raw_msg, HumanMessage(content=resume_str)],
+                "messages": _append_resume_message([raw_msg], resume_str),
                 "user_query": resume_str,
                 "status": "pending",  # re-classify after feedback
             }
 
         target_node = _TOOL_TO_NODE.get(decision.destination)
         if target_node:
-            logger.info(
-                "Request classified",
-                extra={"target": target_node, "reasoning": decision.reasoning, "task_preview": decision.task[:200]},
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Request classified",
+                    extra={"target": target_node, "reasoning": decision.reasoning, "task_preview": decision.task[:200]},
+                )
             return {
                 "dialog_state": target_node,   # push onto stack
                 "active_agent": target_node,
@@ -794,13 +909,13 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         resume_str = str(resume_val) if resume_val is not None else ""
         return {
             "pending_feedback_requests": {},
-            "messages": [raw_msg, HumanMessage(content=resume_str)],
+            "messages": _append_resume_message([raw_msg], resume_str),
             "user_query": resume_str,
             "status": "pending",
         }
 
+    @staticmethod
     def _make_coordinator_node(
-        self,
         coordinator: BaseDeepAgent,
         node_name: str,
         tool_name: str,
@@ -817,26 +932,27 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
           5. Detects cross-domain handoff → sets handoff_request
           6. Or completes → pops dialog_state
         """
+        # Bind the coordinator's transform hooks once; the node runs on
+        # every dispatch and they never change for a given coordinator.
+        input_transform = coordinator.input_transform
+        build_context = coordinator.build_context
+        output_transform = coordinator.output_transform
 
         async def _coordinator_node(
             state: dict[str, Any], config: RunnableConfig, *, writer: StreamWriter,
         ) -> dict[str, Any]:
-            logger.info(
-                f"{node_name} coordinator node invoked",
-                extra={
-                    "session_id": state.get("session_id"),
-                    "task_id": state.get("task_id"),
-                    "user_query_preview": state.get("user_query", "")[:200],
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"{node_name} coordinator node invoked",
+                    extra={
+                        "session_id": state.get("session_id"),
+                        "task_id": state.get("task_id"),
+                        "user_query_preview": state.get("user_query", "")[:200],
+                    },
+                )
 
             # ── Lazy-init the deep agent graph ────────────────────
-            if not coordinator._is_initialized:
-                logger.info(f"Building {node_name} deep agent graph")
-                coordinator._deep_agent_graph = await coordinator.build_agent()
-                coordinator._is_initialized = True
-
-            deep_graph = coordinator._deep_agent_graph
+            deep_graph = await _ensure_coordinator_graph(coordinator, node_name)
             if deep_graph is None:
                 return {
                     "error_state": {
@@ -848,18 +964,19 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 }
 
             # ── Build input ───────────────────────────────────────
+            # One shallow copy of the supervisor state feeds both
+            # input_transform and build_context (both only read it).
             task = state.get("user_query", "")
-
-
-
             send_payload: dict[str, Any] = dict(state)
+            # Always a fresh message: add_messages assigns ``id`` in place, so a
+            # shared instance would make later dispatches overwrite this one.
             send_payload["messages"] = [HumanMessage(content=task)]
             send_payload["user_query"] = task
-            child_input = coordinator.input_transform(send_payload)
+            child_input = input_transform(send_payload)
 
             # ── Build config ──────────────────────────────────────
             child_config: dict[str, Any] = {
-                k: v for k, v in config.items() if k not in ("store", "callbacks")
+                k: v for k, v in config.items() if k not in _CHILD_CONFIG_EXCLUDED_KEYS
             }
             configurable = dict(config.get("configurable", {}))
 
@@ -870,87 +987,74 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 if bound is not None:
                     child_store = getattr(bound, "store", None)
 
-            runtime_obj = configurable.get("__pregel_runtime")
-            if (
-                runtime_obj is not None
-                and hasattr(runtime_obj, "override")
-                and child_store is not None
-            ):
-                configurable["__pregel_runtime"] = runtime_obj.override(
+            runtime_override = getattr(configurable.get("__pregel_runtime"), "override", None)
+            if runtime_override is not None and child_store is not None:
+                configurable["__pregel_runtime"] = runtime_override(
                     store=child_store,
                 )
 
             child_config["configurable"] = {
                 **configurable,
                 "thread_id": f"{state.get('session_id', 'default')}:{tool_name}",
-                "context": coordinator.build_context(
-                    supervisor_state=dict(state),
+                "context": build_context(
+                    supervisor_state=send_payload,
                 ),
             }
-            child_config["recursion_limit"] = 250
+            child_config["recursion_limit"] = _COORDINATOR_RECURSION_LIMIT
 
             # ── Invoke deep agent ─────────────────────────────────
             try:
                 final_state = None
-                async for chunk in deep_graph.astream(
+                # aclosing() shuts the child stream down deterministically
+                # (cancellation, interrupt, error) instead of leaving the
+                # async generator for the GC to finalise.
+                async with aclosing(deep_graph.astream(
                     child_input,
                     config=cast("RunnableConfig", child_config),
                     stream_mode=cast("list[StreamMode]", ["messages", "values"]),
                     subgraphs=True,
                     version="v2",
-                ):
-                    chunk_type = chunk.get("type", "") if isinstance(chunk, dict) else ""
-
-                    if chunk_type == "messages":
-                        # Forward LLM tokens to parent via custom stream
-                        msg_data = chunk.get("data")
-                        if msg_data is not None:
-                            writer({
-                                "kind": "deep_agent_message",
-                                "node": node_name,
-                                "data": msg_data,
-                                "ns": chunk.get("ns", ()),
-                            })
-
-                    elif chunk_type == "values":
-                        # Capture final state from values stream
-                        val = chunk.get("data")
-                        if isinstance(val, dict):
-                            final_state = val
-
-                    # Other chunk types — ignore silently
-
-            except GraphInterrupt as gi:
-                # Check if the interrupt is a chat_continue carrying a
-                # handoff/scope-refusal.  If so, DON'T re-raise — instead
-                # intercept and return a handoff_request so the supervisor
-                # routes to the correct coordinator.
-                try:
-                    from k8s_autopilot.core.state.handoff_contracts import (  # noqa: PLC0415
-                        extract_handoff_from_text,
-                    )
-                    interrupts = gi.args[0] if gi.args else []
-                    for intr in (interrupts if isinstance(interrupts, (list, tuple)) else [interrupts]):
-                        intr_val = getattr(intr, "value", intr)
-                        if not isinstance(intr_val, dict):
-                            continue
-                        # Ensure no handoff extraction happens for free-form text on interrupt
-                except Exception:  # noqa: BLE001
-                    pass  # fallback: re-raise the interrupt normally
-                logger.info(f"{node_name} paused for human input (interrupt)")
+                )) as child_stream:
+                    async for chunk in child_stream:
+                        chunk_type = chunk.get("type", "") if isinstance(chunk, dict) else ""
+
+                        if chunk_type == "messages":
+                            # Forward LLM tokens to parent via custom stream
+                            msg_data = chunk.get("data")
+                            if msg_data is not None:
+                                writer({
+                                    "kind": "deep_agent_message",
+                                    "node": node_name,
+                                    "data": msg_data,
+                                    "ns": chunk.get("ns", ()),
+                                })
+
+                        elif chunk_type == "values":
+                            # Capture final state from values stream; only
+                            # the latest snapshot is kept alive.
+                            val = chunk.get("data")
+                            if isinstance(val, dict):
+                                final_state = val
+
+                        # Other chunk types — ignore silently
+
+            except GraphInterrupt:
+                # Interrupts are never mined for handoffs — free-form
+                # interrupt text must reach the user, so re-raise as-is.
+                logger.info("%s paused for human input (interrupt)", node_name)
                 raise
             except Exception as exc:
-                import traceback
+                err_str = str(exc)
                 logger.error(
                     f"{node_name} execution failed\n{traceback.format_exc()}",
-                    extra={"error": str(exc)},
+                    extra={"error": err_str},
                 )
                 return {
                     "status": "error",
                     "error_state": {
                         "type": "execution_error",
                         "agent": node_name,
-                        "message": str(exc),
+                        "message": err_str,
                     },
                     "dialog_state": "pop",
                 }
@@ -971,12 +1075,12 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 child_dict: dict[str, Any]
                 if isinstance(final_state, dict):
                     child_dict = cast("dict[str, Any]", final_state)
-                elif hasattr(final_state, "model_dump"):
-                    child_dict = cast("dict[str, Any]", final_state.model_dump())
+                elif (model_dump := getattr(final_state, "model_dump", None)) is not None:
+                    child_dict = cast("dict[str, Any]", model_dump())
                 else:
                     child_dict = cast("dict[str, Any]", dict(final_state))
 
-                payload_out = coordinator.output_transform(child_dict)
+                payload_out = output_transform(child_dict)
                 final_msg = payload_out.get("final_message", f"{node_name} completed.")
 
                 # ── Escalation from deep agent tool? ──────────────
@@ -991,8 +1095,11 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                     messages = child_dict.get("messages", [])
                     for i in range(len(messages) - 1, -1, -1):
                         msg = messages[i]
-                        if getattr(msg, "type", None) == "ai" and hasattr(msg, "tool_calls"):
-                            for tc in msg.tool_calls:
+                        if getattr(msg, "type", None) != "ai":
+                            continue
+                        tool_calls = getattr(msg, "tool_calls", None)
+                        if tool_calls is not None:
+                            for tc in tool_calls:
                                 if tc.get("name") == "escalate_to_supervisor":
                                     args = tc.get("args", {})
                                     escalation = {
@@ -1006,13 +1113,14 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                     esc_user_req = str(escalation.get("user_request") or task or "")
                     esc_reason = str(escalation.get("reason") or "Out of scope")
 
-                    logger.info(
-                        f"{node_name} escalation via tool — re-routing",
-                        extra={
-                            "user_request": esc_user_req[:200],
-                            "reason": esc_reason[:200],
-                        },
-                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            f"{node_name} escalation via tool — re-routing",
+                            extra={
+                                "user_request": esc_user_req[:200],
+                                "reason": esc_reason[:200],
+                            },
+                        )
 
                     return {
                         output_key: {
@@ -1029,13 +1137,14 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 # ── Cross-domain handoff? ─────────────────────────
                 if "handoff_request" in payload_out:
                     hr = payload_out["handoff_request"]
-                    logger.info(
-                        f"{node_name} cross-domain handoff detected natively",
-                        extra={
-                            "target": hr.get("target_agent"),
-                            "intent": hr.get("intent", "")[:100],
-                        },
-                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            f"{node_name} cross-domain handoff detected natively",
+                            extra={
+                                "target": hr.get("target_agent"),
+                                "intent": hr.get("intent", "")[:100],
+                            },
+                        )
                     return {
                         output_key: payload_out,
                         "handoff_request": hr,
@@ -1050,29 +1159,29 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                     # This coordinator was invoked as a callee for another
                     # coordinator.  Produce a HandoffResult so the caller
                     # gets structured cross-domain results.
-                    from k8s_autopilot.core.state.handoff_contracts import (  # noqa: PLC0415
-                        HandoffResult,
-                    )
-
                     result_payload = {
                         k: v for k, v in payload_out.items()
                         if k not in ("final_message", "handoff_request")
                     }
+                    # Bound once: the log preview re-slices this short
+                    # copy rather than the full coordinator output.
+                    return_summary = final_msg[:500]
                     handoff_result = HandoffResult(
                         source_agent=tool_name,
                         target_agent=callee_return_to,
                         correlation_id=callee_corr_id,
                         status=payload_out.get("status", "completed"),
-                        summary=final_msg[:500],
+                        summary=return_summary,
                         payload=result_payload,
                     )
-                    logger.info(
-                        f"{node_name} cross-domain return → {callee_return_to}",
-                        extra={
-                            "correlation_id": callee_corr_id,
-                            "summary_preview": final_msg[:100],
-                        },
-                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            f"{node_name} cross-domain return → {callee_return_to}",
+                            extra={
+                                "correlation_id": callee_corr_id,
+                                "summary_preview": return_summary[:100],
+                            },
+                        )
                     return {
                         output_key: payload_out,
                         "handoff_result": handoff_result,
@@ -1105,17 +1214,17 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 return update
 
             except Exception as exc:
-                import traceback as tb
+                err_str = str(exc)
                 logger.error(
                     f"{node_name} post-processing failed",
-                    extra={"error": str(exc), "traceback": tb.format_exc()},
+                    extra={"error": err_str, "traceback": traceback.format_exc()},
                 )
                 return {
                     "status": "error",
                     "error_state": {
                         "type": "post_process_error",
                         "agent": node_name,
-                        "message": str(exc),
+                        "message": err_str,
                     },
                     "dialog_state": "pop",
                 }
@@ -1160,7 +1269,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 "error_state": {},
                 "pending_feedback_requests": {},
                 "dialog_state": clear_stack[0] if clear_stack else [],
-                "messages": [HumanMessage(content=resume_str)],
+                "messages": _append_resume_message([], resume_str),
                 "user_query": resume_str,
                 "status": "pending",
             }
@@ -1182,7 +1291,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         return {
             "error_state": {},
             "pending_feedback_requests": {},
-            "messages": [HumanMessage(content=resume_str)],
+            "messages": _append_resume_message([], resume_str),
             "user_query": resume_str,
             "status": "pending",
         }
@@ -1221,15 +1330,15 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         else:
             stream_input = self._build_initial_input(str(query), context_id, task_id)
 
-        logger.info(
-            "Starting supervisor stream",
-            extra={"task_id": task_id, "context_id": context_id, "is_resume": is_resume},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Starting supervisor stream",
+                extra={"task_id": task_id, "context_id": context_id, "is_resume": is_resume},
+            )
 
-        rec_limit = getattr(self.config_instance, "recursion_limit", 50)
         config = cast(
             "RunnableConfig",
-            {"configurable": {"thread_id": context_id, "recursion_limit": rec_limit}},
+            {"configurable": {"thread_id": context_id, "recursion_limit": self._recursion_limit}},
         )
 
         async for response in self._run_stream(stream_input, config, context_id, task_id):
@@ -1270,10 +1379,11 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         action_count = await self._get_pending_action_count(state_config)
 
         if action_count > 0:
-            logger.info(
-                "Expanding single decision for batch HITL resume",
-                extra={"decision_type": decision_type, "action_count": action_count},
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Expanding single decision for batch HITL resume",
+                    extra={"decision_type": decision_type, "action_count": action_count},
+                )
             decision_obj = {"type": decision_type}
             if decision_message:
                 decision_obj["message"] = decision_message
@@ -1316,6 +1426,10 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         """
         assert self._graph is not None  # noqa: S101
 
+        # Common keys for every streamed token's metadata — merged into a
+        # fresh dict per response (consumers may mutate metadata).
+        working_meta = {"context_id": context_id, "task_id": task_id, "status": "working"}
+
         def _make_working(content: Any, **meta_extra: Any) -> AgentResponse:
             """Factory for working-state AgentResponse objects."""
             return AgentResponse(
@@ -1323,7 +1437,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 response_type="token",
                 is_task_complete=False,
                 require_user_input=False,
-                metadata={"context_id": context_id, "task_id": task_id, "status": "working", **meta_extra},
+                metadata={**working_meta, **meta_extra} if meta_extra else working_meta.copy(),
             )
 
         # Track current agent for delegation labels
@@ -1333,47 +1447,42 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         _final_output: dict[str, Any] = {}
 
         try:
-            async for chunk in self._graph.astream(
+            # Same deterministic shutdown as the coordinator child streams:
+            # an early return or a cancelled client closes the graph stream
+            # here rather than at GC time, racing the tracer flush below.
+            async with aclosing(self._graph.astream(
                 stream_input,
                 config=config,
                 stream_mode=cast("list[StreamMode]", ["updates", "custom"]),
                 subgraphs=True,
                 version="v2",
-            ):
-                chunk_type = chunk.get("type", "")
-                chunk_ns = chunk.get("ns", ())
-                chunk_data = chunk.get("data")
-
-                # ── Identify source from namespace ────────────────
-                # ns=() → supervisor level
-                # ns=("helm_agent:xxx",) → coordinator subgraph
-                # ns=("helm_agent:xxx", "tools:yyy") → deep agent tool
-                is_subgraph = bool(chunk_ns)
-                source = "supervisor"
-                if chunk_ns:
-                    # Use the first namespace segment as source
-                    first_ns = chunk_ns[0] if chunk_ns else ""
-                    # Extract the node name from "node_name:run_id" format
-                    source = first_ns.split(":")[0] if ":" in first_ns else first_ns
-
-                # NOTE: 'messages' stream mode removed from parent — the supervisor
-                # is a deterministic router with no LLM. All deep-agent LLM tokens
-                # are relayed via StreamWriter → 'custom' channel below.
-
-                # ── Custom stream: forwarded deep agent tokens ─────
-                if chunk_type == "custom" and isinstance(chunk_data, dict):
-                    kind = chunk_data.get("kind", "")
-                    if kind == "deep_agent_message":
-                        fwd_data = chunk_data.get("data")
-                        fwd_node = chunk_data.get("node", "agent")
-                        fwd_ns = chunk_data.get("ns", ())
-                        if fwd_data is not None:
+                durability=self._durability,
+            )) as graph_stream:
+                async for chunk in graph_stream:
+                    chunk_get = chunk.get
+                    chunk_type = chunk_get("type", "")
+                    chunk_data = chunk_get("data")
+
+                    # NOTE: 'messages' stream mode removed from parent — the supervisor
+                    # is a deterministic router with no LLM. All deep-agent LLM tokens
+                    # are relayed via StreamWriter → 'custom' channel below.
+
+                    # ── Custom stream: forwarded deep agent tokens ─────
+                    if chunk_type == "custom" and isinstance(chunk_data, dict):
+                        cd_get = chunk_data.get  # bound once for the envelope reads
+                        kind = cd_get("kind", "")
+                        if kind == "deep_agent_message":
+                            fwd_data = cd_get("data")
+                            fwd_node = cd_get("node", "agent")
+                            fwd_ns = cd_get("ns", ())
+                            # "messages"-mode payloads are (message, metadata) 2-tuples;
+                            # anything else (None, dicts, strings) is skipped.
                             if isinstance(fwd_data, (tuple, list)) and len(fwd_data) == 2:
                                 fwd_msg, fwd_meta = fwd_data
-                                fwd_source = fwd_node
-                                if isinstance(fwd_ns, (list, tuple)) and fwd_ns:
-                                    first_seg = str(fwd_ns[0])
-                                    fwd_source = first_seg.split(":")[0] if ":" in first_seg else first_seg
+                            else:
+                                fwd_msg = None
+                            if fwd_msg is not None:
+                                fwd_source = _ns_source(fwd_ns) or fwd_node
 
                                 fwd_agent = fwd_meta.get("lc_agent_name", "") if isinstance(fwd_meta, dict) else ""
                                 fwd_display = str(fwd_agent or fwd_source or fwd_node)
@@ -1390,7 +1499,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                                             message_type="delegation",
                                         )
 
-                                if isinstance(fwd_msg, (AIMessage, AIMessageChunk)):
+                                if isinstance(fwd_msg, AIMessage):  # AIMessageChunk subclasses AIMessage
                                     # Reasoning tokens (provider-agnostic)
                                     reasoning = _extract_reasoning_text(fwd_msg)
                                     if reasoning:
@@ -1401,7 +1510,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                                             message_type="reasoning",
                                         )
                                     # Text content
-                                    text = _extract_content_text(getattr(fwd_msg, "content", ""))
+                                    text = _extract_content_text(fwd_msg.content)
                                     if text:
                                         yield _make_working(
                                             text,
@@ -1421,10 +1530,10 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                                                 tool_name=tc_n,
                                             )
                                 elif isinstance(fwd_msg, ToolMessage):
-                                    t_name = getattr(fwd_msg, "name", "tool")
-                                    raw_content = getattr(fwd_msg, "content", "")
+                                    t_name = fwd_msg.name
+                                    raw_content = fwd_msg.content
                                     snippet = _sanitize_result_snippet(raw_content)
-                                    status = getattr(fwd_msg, "status", "success")
+                                    status = fwd_msg.status
                                     emoji = "❌" if status == "error" else "✅"
                                     yield _make_working(
                                         f"> {emoji} **{_humanize_tool_name(t_name)}** — {snippet or 'completed.'}\n\n",
@@ -1434,36 +1543,31 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                                         raw_tool_result=raw_content,
                                     )
 
-                # ── Updates stream: node completions + interrupts ──
-                elif chunk_type == "updates" and isinstance(chunk_data, dict):
-                    # Check for interrupts
-                    interrupt_data = chunk_data.get("__interrupt__")
-                    if interrupt_data:
-                        if isinstance(interrupt_data, (list, tuple)):
-                            _interrupt_payload.extend(interrupt_data)
-                        else:
-                            _interrupt_payload.append(interrupt_data)
-                        continue
-
-                    # Track final output from finalize_response or last node
-                    for node_name, update in chunk_data.items():
-                        if isinstance(update, dict):
-                            _final_output.update(update)
+                    # ── Updates stream: node completions + interrupts ──
+                    elif chunk_type == "updates" and isinstance(chunk_data, dict):
+                        # Check for interrupts
+                        interrupt_data = chunk_data.get("__interrupt__")
+                        if interrupt_data:
+                            if isinstance(interrupt_data, (list, tuple)):
+                                _interrupt_payload.extend(interrupt_data)
+                            else:
+                                _interrupt_payload.append(interrupt_data)
+                            continue
+
+                        # Track final output from finalize_response or last node
+                        for node_name, update in chunk_data.items():
+                            if isinstance(update, dict):
+                                _final_output.update(update)
 
             # ── Post-stream: interrupt detection ──────────────────
             if _interrupt_payload:
                 interrupts = tuple(_interrupt_payload)
                 tool_name = _extract_interrupt_tool_name(interrupts)
                 if tool_name:
-                    yield AgentResponse(
-                        content=f"> **Result** · `{tool_name}` — completed, awaiting user input.\n\n",
-                        response_type="token",
-                        is_task_complete=False,
-                        require_user_input=False,
-                        metadata={
-                            "context_id": context_id, "task_id": task_id,
-                            "status": "working", "message_type": "tool_result", "tool_name": tool_name,
-                        },
+                    yield _make_working(
+                        f"> **Result** · `{tool_name}` — completed, awaiting user input.\n\n",
+                        message_type="tool_result",
+                        tool_name=tool_name,
                     )
 
                 yield self._build_interrupt_response(interrupts, context_id, task_id)
@@ -1482,7 +1586,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 )
 
         except Exception:  # noqa: BLE001
-            import traceback; traceback.print_exc()
+            traceback.print_exc()
             logger.exception("Stream execution failed", extra={"task_id": task_id, "context_id": context_id})
             yield AgentResponse(
                 response_type="error",
@@ -1493,11 +1597,11 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                 metadata={"context_id": context_id, "task_id": task_id, "status": "error"},
             )
         finally:
-            try:
-                from langchain_core.tracers.langchain import wait_for_all_tracers  # noqa: PLC0415
-                wait_for_all_tracers()
-            except (ImportError, Exception):  # noqa: BLE001, S110
-                pass
+            if wait_for_all_tracers is not None:
+                try:
+                    wait_for_all_tracers()
+                except Exception:  # noqa: BLE001, S110
+                    pass
 
     # ── v3 completion handler ──────────────────────────────────────────
 
@@ -1530,10 +1634,11 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         is_complete = (not stack) or status == "completed"
 
         if not is_complete:
-            logger.info(
-                "v3 completion — dialog_state non-empty, treating as in-progress",
-                extra={"stack": stack, "status": status},
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "v3 completion — dialog_state non-empty, treating as in-progress",
+                    extra={"stack": stack, "status": status},
+                )
             return AgentResponse(
                 content="Processing continues...",
                 response_type="token",
@@ -1579,46 +1684,18 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
         value = getattr(first, "value", first)
 
         if not isinstance(value, dict):
-            value = {"type": "generic", "data": str(value)}
-
-        # pending_feedback_requests
-        feedback_raw = value.get("pending_feedback_requests", {})
-        if feedback_raw and isinstance(feedback_raw, dict):
-            return AgentResponse(
-                content={
-                    "type": "human_feedback_request",
-                    "question": feedback_raw.get("question", "Input required"),
-                    "context": feedback_raw.get("context", ""),
-                    "status": feedback_raw.get("status", "input_required"),
-                },
-                response_type="human_input",
-                is_task_complete=False,
-                require_user_input=True,
-                metadata={
-                    "context_id": context_id, "task_id": task_id,
-                    "interrupt_type": "human_feedback", "pending_feedback_requests": feedback_raw,
-                },
+            # Nothing keyed can match a coerced payload — go straight to generic
+            return _generic_interrupt_response(
+                {"type": "generic", "data": str(value)}, context_id, task_id,
             )
 
-        # action_requests (HITL middleware)
-        action_requests: list[dict] = cast(list[dict], value.get("action_requests", []))
-        if action_requests:
-            summary = k8sAutopilotSupervisorAgent._format_action_requests_summary(action_requests)
-            return AgentResponse(
-                content={
-                    "type": "hitl_approval",
-                    "summary": summary,
-                    "action_requests": action_requests,
-                    "original_interrupt": value,
-                },
-                response_type="human_input",
-                is_task_complete=False,
-                require_user_input=True,
-                metadata={
-                    "context_id": context_id, "task_id": task_id,
-                    "interrupt_type": "hitl_approval", "action_request_count": len(action_requests),
-                },
-            )
+        # Keyed payloads (feedback, HITL approvals) — first match wins
+        for key, handler in _INTERRUPT_HANDLERS:
+            raw = value.get(key)
+            if raw:
+                response = handler(raw, value, context_id, task_id)
+                if response is not None:
+                    return response
 
         # Custom interrupt types
         custom_type = value.get("type", "")
@@ -1632,20 +1709,7 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             )
 
         # Fallback: generic interrupt
-        return AgentResponse(
-            content={
-                "type": "generic_interrupt",
-                "message": (
-                    value.get("message") or value.get("summary")
-                    or value.get("question") or "Human input required"
-                ),
-                "data": value,
-            },
-            response_type="human_input",
-            is_task_complete=False,
-            require_user_input=True,
-            metadata={"context_id": context_id, "task_id": task_id, "interrupt_type": "generic"},
-        )
+        return _generic_interrupt_response(value, context_id, task_id)
 
     # ── Batch HITL helpers ─────────────────────────────────────────────
 
@@ -1661,7 +1725,8 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
                         action_requests = value.get("action_requests", [])
                         if action_requests:
                             count = len(action_requests)
-                            logger.info("Detected pending action_requests", extra={"count": count})
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("Detected pending action_requests", extra={"count": count})
                             return max(count, 1)
         except Exception:  # noqa: BLE001
             logger.warning("Could not inspect graph state for pending action count — defaulting to 0")
@@ -1860,15 +1925,24 @@ class k8sAutopilotSupervisorAgent(BaseAgent):  # noqa: N801
             return SupervisorWorkflowState(**existing)
         return SupervisorWorkflowState()
 
+    def _recompute_ready(self) -> None:
+        """Re-derive readiness after the model, graph or agent registry changes."""
+        self._ready = bool(self.model and self._graph and (self.agents or self._coordinator))
+
     @log_sync
     def is_ready(self) -> bool:
-        """Check if the supervisor is ready for use."""
-        return bool(self.model and self._graph and (self.agents or self._coordinator))
+        """Check if the supervisor is ready for use.
+
+        Readiness is computed once at construction (and whenever
+        ``_recompute_ready`` is called), so liveness/readiness probes
+        only pay for a single attribute read.
+        """
+        return self._ready
 
     @log_sync
     def list_agents(self) -> list[str]:
-        """List all available agents."""
-        return list(self.agents.keys())
+        """List all available agents (served from the cached name snapshot)."""
+        return list(self._agents_tuple)
 
 
 # ---------------------------------------------------------------------------
@@ -1896,10 +1970,8 @@ async def _handle_tool_call_delta(
     tc_display = _humanize_tool_name(tc_name)
     tc_input = delta.get("tool_input")
     args_display = _format_tool_args(tc_input)
-    content = f"> **Tool Call** · `{tc_display}`  \n"
-    if args_display:
-        content += f"> **Input:** {args_display}  \n"
-    content += "\n"
+    input_line = f"> **Input:** {args_display}  \n" if args_display else ""
+    content = f"> **Tool Call** · `{tc_display}`  \n{input_line}\n"
     await queue.put(make_response(
         content,
         node=delta.get("node", "subagent"), source=source,
@@ -1915,10 +1987,8 @@ async def _handle_tool_started_delta(
     tc_display = _humanize_tool_name(tc_name)
     tc_input = delta.get("tool_input")
     args_display = _format_tool_args(tc_input)
-    content = f"> 🔧 **{tc_display}**  \n"
-    if args_display:
-        content += f"> Input: {args_display}  \n"
-    content += "\n"
+    input_line = f"> Input: {args_display}  \n" if args_display else ""
+    content = f"> 🔧 **{tc_display}**  \n{input_line}\n"
     await queue.put(make_response(
         content,
         source=source, message_type="tool_started",
@@ -1952,6 +2022,88 @@ _DELTA_HANDLERS: dict[str, Any] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Interrupt payload handlers
+# ---------------------------------------------------------------------------
+
+# Keyed interrupt handler: (payload under its key, full interrupt value,
+# context_id, task_id) -> response, or None to fall through to the next one.
+_InterruptHandler = Callable[[Any, dict[str, Any], str, str], "AgentResponse | None"]
+
+
+def _feedback_interrupt_response(
+    feedback_raw: Any, value: dict[str, Any], context_id: str, task_id: str,
+) -> AgentResponse | None:
+    """Build a human-feedback request; ``value`` is unused (shared signature)."""
+    if not isinstance(feedback_raw, dict):
+        return None
+    get = feedback_raw.get
+    return AgentResponse(
+        content={
+            "type": "human_feedback_request",
+            "question": get("question", "Input required"),
+            "context": get("context", ""),
+            "status": get("status", "input_required"),
+        },
+        response_type="human_input",
+        is_task_complete=False,
+        require_user_input=True,
+        metadata={
+            "context_id": context_id, "task_id": task_id,
+            "interrupt_type": "human_feedback", "pending_feedback_requests": feedback_raw,
+        },
+    )
+
+
+def _approval_interrupt_response(
+    action_requests: Any, value: dict[str, Any], context_id: str, task_id: str,
+) -> AgentResponse | None:
+    """Build a HITL approval request from the middleware's ``action_requests``."""
+    summary = k8sAutopilotSupervisorAgent._format_action_requests_summary(action_requests)
+    return AgentResponse(
+        content={
+            "type": "hitl_approval",
+            "summary": summary,
+            "action_requests": action_requests,
+            "original_interrupt": value,
+        },
+        response_type="human_input",
+        is_task_complete=False,
+        require_user_input=True,
+        metadata={
+            "context_id": context_id, "task_id": task_id,
+            "interrupt_type": "hitl_approval", "action_request_count": len(action_requests),
+        },
+    )
+
+
+def _generic_interrupt_response(
+    value: dict[str, Any], context_id: str, task_id: str,
+) -> AgentResponse:
+    """Build a generic input request for an interrupt no handler claimed."""
+    return AgentResponse(
+        content={
+            "type": "generic_interrupt",
+            "message": (
+                value.get("message") or value.get("summary")
+                or value.get("question") or "Human input required"
+            ),
+            "data": value,
+        },
+        response_type="human_input",
+        is_task_complete=False,
+        require_user_input=True,
+        metadata={"context_id": context_id, "task_id": task_id, "interrupt_type": "generic"},
+    )
+
+
+# Ordered by precedence: a payload carrying both keys is a feedback request.
+_INTERRUPT_HANDLERS: tuple[tuple[str, _InterruptHandler], ...] = (
+    ("pending_feedback_requests", _feedback_interrupt_response),
+    ("action_requests", _approval_interrupt_response),
+)
+
+
 # ---------------------------------------------------------------------------
 # Factory function
 # ---------------------------------------------------------------------------
@@ -17,8 +17,10 @@ Reference: aws-orchestrator-agent/core/agents/types.py
 Docs: https://docs.langchain.com/oss/python/deepagents/customization
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from pydantic import BaseModel, Field, ConfigDict
+from dataclasses import dataclass, field
+from pydantic import BaseModel
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -42,7 +44,8 @@ if TYPE_CHECKING:
 # AgentResponse
 # ---------------------------------------------------------------------------
 
-class AgentResponse(BaseModel):
+@dataclass(slots=True)
+class AgentResponse:
     """Response from an agent during execution.
 
     This represents a single response item from the agent's stream,
@@ -54,35 +57,26 @@ class AgentResponse(BaseModel):
         - 'data':      Structured data payload
         - 'interrupt':  HITL interrupt requiring user input
         - 'error':     Error condition
+
+    One instance is yielded per streamed step and every field is produced
+    internally, so this is a slotted dataclass rather than a pydantic
+    model: no validation pass and no per-instance ``__dict__``.
     """
 
-    model_config = ConfigDict(extra="allow")
-
-    content: Any = Field(..., description="The response content (text or data)")
-    response_type: str = Field(
-        default="text",
-        description="'token' | 'text' | 'data' | 'interrupt' | 'error'",
-    )
-    is_task_complete: bool = Field(
-        default=False,
-        description="Whether this response indicates task completion",
-    )
-    require_user_input: bool = Field(
-        default=False,
-        description="Whether this response requires user input to continue",
-    )
-    metadata: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Additional metadata about the response",
-    )
-    error: Optional[str] = Field(
-        default=None,
-        description="Error message if response_type='error'",
-    )
-    root: Optional[Any] = Field(
-        default=None,
-        description="Root object for A2A protocol integration",
-    )
+    content: Any
+    """The response content (text or data)."""
+    response_type: str = "text"
+    """'token' | 'text' | 'data' | 'interrupt' | 'error'."""
+    is_task_complete: bool = False
+    """Whether this response indicates task completion."""
+    require_user_input: bool = False
+    """Whether this response requires user input to continue."""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    """Additional metadata about the response."""
+    error: Optional[str] = None
+    """Error message if response_type='error'."""
+    root: Optional[Any] = None
+    """Root object for A2A protocol integration."""
 
 
 # ---------------------------------------------------------------------------
@@ -145,6 +139,10 @@ class BaseSubgraphAgent(ABC):
     from this class and implement the required abstract methods.
     """
 
+    # Checkpointer injected by the supervisor; declared here so every
+    # subgraph agent exposes ``memory`` without per-instance setup.
+    _memory: Any = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -160,7 +158,7 @@ class BaseSubgraphAgent(ABC):
     @property
     def memory(self) -> Any:
         """Memory/checkpointer instance for this agent."""
-        return None
+        return self._memory
 
     @memory.setter
     def memory(self, value):  # type: ignore[override]
@@ -224,14 +222,20 @@ class BaseDeepAgent(ABC):
             from k8s_autopilot.config.config import Config
             config = Config()
         self._config: "Config" = config
-        # JIT-built deep agent graph (set by supervisor tool wrapper)
+        # JIT-built deep agent graph (see ensure_graph)
         self._deep_agent_graph: Optional[CompiledStateGraph] = None
         self._is_initialized: bool = False
+        self._build_task: Optional["asyncio.Future[CompiledStateGraph]"] = None
 
     @property
     def config(self) -> "Config":
         return self._config
 
+    @property
+    def is_initialized(self) -> bool:
+        """True once ``ensure_graph()`` has built the deep agent graph."""
+        return self._is_initialized
+
     # ── Abstract — MUST override ──────────────────────────────────────────
 
     @property
@@ -370,8 +374,10 @@ class BaseDeepAgent(ABC):
         ``{final_message: ..., status: "completed"}``.
         """
         state: Dict[str, Any] = agent_state
-        if not isinstance(agent_state, dict) and hasattr(agent_state, "model_dump"):
-            state = agent_state.model_dump()
+        if not isinstance(agent_state, dict):
+            model_dump = getattr(agent_state, "model_dump", None)
+            if model_dump is not None:
+                state = model_dump()
 
         final_message: Optional[str] = None
         messages = state.get("messages", [])
@@ -516,6 +522,27 @@ See AGENTS.md for: write_todos examples, walkthrough template, rejection protoco
         checkpointer = self.build_checkpointer()
         return self.make_backend(), store, checkpointer
 
+    async def ensure_graph(self) -> CompiledStateGraph:
+        """
+        Return the deep agent graph, building it on first use.
+
+        Concurrent callers share a single ``build_agent()`` task, and a
+        caller that is cancelled or times out does not cancel the build for
+        the others.  A failed build is retried by the next call.
+        """
+        if self._is_initialized:
+            return cast(CompiledStateGraph, self._deep_agent_graph)
+        task = self._build_task
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = self._build_task = asyncio.ensure_future(self._build_graph())
+        return await asyncio.shield(task)
+
+    async def _build_graph(self) -> CompiledStateGraph:
+        graph = await self.build_agent()
+        self._deep_agent_graph = graph
+        self._is_initialized = True
+        return graph
+
 
 
 # ---------------------------------------------------------------------------
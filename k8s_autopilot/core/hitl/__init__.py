@@ -3,9 +3,35 @@
 Exports:
     - create_hitl_tools(): Tools for supervisor/coordinator
     - get_checkpointer(): Checkpointer factory
+
+Exports are resolved lazily (PEP 562) so importing the package for the
+checkpointer does not also load the tool definitions, and vice versa.
 """
 
-from k8s_autopilot.core.hitl.tools import create_hitl_tools, request_human_input
-from k8s_autopilot.core.hitl.checkpointer import get_checkpointer
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from k8s_autopilot.core.hitl.checkpointer import get_checkpointer
+    from k8s_autopilot.core.hitl.tools import create_hitl_tools, request_human_input
+
+_LAZY_EXPORTS = {
+    "create_hitl_tools": "k8s_autopilot.core.hitl.tools",
+    "request_human_input": "k8s_autopilot.core.hitl.tools",
+    "get_checkpointer": "k8s_autopilot.core.hitl.checkpointer",
+}
 
 __all__ = ["create_hitl_tools", "request_human_input", "get_checkpointer"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
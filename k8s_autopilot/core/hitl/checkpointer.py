@@ -2,19 +2,23 @@
 Checkpointer configuration and management for HITL.
 
 Supports both PostgreSQL (production) and MemorySaver (development) checkpointers.
+The PostgreSQL checkpointer is async and pooled (``PooledAsyncPostgresSaver``) so
+checkpoint I/O never blocks the event loop the supervisor streams on.
 """
 
-from typing import Optional, Literal
+import os
+import threading
+from typing import Dict, Literal, Optional, Tuple
 from langgraph.checkpoint.memory import MemorySaver
 from k8s_autopilot.config.config import Config
 from k8s_autopilot.utils.logger import AgentLogger
 
 # Optional PostgreSQL checkpointer import
 try:
-    from langgraph.checkpoint.postgres import PostgresSaver
+    from k8s_autopilot.core.hitl.pooled_saver import PooledAsyncPostgresSaver
     POSTGRES_AVAILABLE = True
 except ImportError:
-    PostgresSaver = None  # type: ignore
+    PooledAsyncPostgresSaver = None  # type: ignore
     POSTGRES_AVAILABLE = False
 
 # Create logger for HITL module
@@ -22,28 +26,49 @@ hitl_logger = AgentLogger("k8sAutopilotHITL")
 
 CheckpointerType = Literal["postgres", "memory"]
 
+# One pooled saver per (database URI, auto_setup) per process, so every
+# agent shares a pool and setup()'s DDL round-trips run once per URI.
+# MemorySaver instances are never shared — each holds its own threads.
+_POSTGRES_SAVERS: Dict[Tuple[str, bool], "PooledAsyncPostgresSaver"] = {}
+_POSTGRES_SAVERS_LOCK = threading.Lock()
+
+
+def invalidate_checkpointer_cache() -> None:
+    """Forget cached PostgreSQL checkpointers (tests / URI rotation).
+
+    Does not close their pools; use :func:`aclose_checkpointers` for that.
+    """
+    with _POSTGRES_SAVERS_LOCK:
+        _POSTGRES_SAVERS.clear()
+
+
+async def aclose_checkpointers() -> None:
+    """Close every cached PostgreSQL checkpointer pool and forget them."""
+    with _POSTGRES_SAVERS_LOCK:
+        savers = list(_POSTGRES_SAVERS.values())
+        _POSTGRES_SAVERS.clear()
+    for saver in savers:
+        await saver.aclose()
+
 
 def get_database_uri(config: Optional[Config] = None) -> Optional[str]:
     """
     Get database URI from configuration.
     
     Args:
-        config: Optional Config instance. If None, creates a new one.
+        config: Optional Config instance. ``DATABASE_URI`` on it takes
+            precedence over the environment.
         
     Returns:
         Database URI string or None if not configured.
     """
-    if config is None:
-        config = Config()
-    
-    # Check for database URI in config
-    db_uri = getattr(config, "DATABASE_URI", None)
+    # DefaultConfig declares no DATABASE_URI, so a fresh Config() could only
+    # echo the environment; read it directly instead of building one.
+    db_uri = getattr(config, "DATABASE_URI", None) if config is not None else None
+    if db_uri:
+        return db_uri
     
-    # Also check environment variable
-    import os
-    db_uri = db_uri or os.getenv("DATABASE_URI") or os.getenv("POSTGRES_URI")
-    
-    return db_uri
+    return os.getenv("DATABASE_URI") or os.getenv("POSTGRES_URI")
 
 
 def create_checkpointer(
@@ -62,7 +87,9 @@ def create_checkpointer(
         auto_setup: Whether to automatically setup PostgreSQL tables
         
     Returns:
-        Checkpointer instance (PostgresSaver or MemorySaver)
+        Checkpointer instance (PooledAsyncPostgresSaver or MemorySaver).
+        The PostgreSQL pool is opened, and tables set up when
+        ``auto_setup`` is True, on the first async checkpoint operation.
         
     Raises:
         ValueError: If checkpointer_type is "postgres" but no database URI provided
@@ -76,7 +103,7 @@ def create_checkpointer(
     
     elif checkpointer_type == "postgres":
         # Check if PostgreSQL checkpointer is available
-        if not POSTGRES_AVAILABLE or PostgresSaver is None:
+        if not POSTGRES_AVAILABLE or PooledAsyncPostgresSaver is None:
             hitl_logger.warning("PostgreSQL checkpointer not available, falling back to MemorySaver", extra={
                     "checkpointer_type": "postgres",
                     "fallback": "memory",
@@ -94,24 +121,37 @@ def create_checkpointer(
                 })
             return MemorySaver()
         
+        key = (db_uri, auto_setup)
+        cached = _POSTGRES_SAVERS.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            hitl_logger.info("Creating PostgresSaver checkpointer", extra={
-                    "checkpointer_type": "postgres",
-                    "has_uri": bool(db_uri),
-                    "auto_setup": auto_setup
-                }
-            )
-            
-            cm = PostgresSaver.from_conn_string(db_uri)
-            # LangGraph PostgresSaver.from_conn_string returns a context manager.
-            # We must enter it to acquire the actual PostgresSaver instance.
-            checkpointer = cm.__enter__()  # type: ignore
-            
-            if auto_setup:
-                checkpointer.setup()
-                hitl_logger.info("PostgreSQL checkpointer tables initialized", extra={"checkpointer_type": "postgres"})
-            
-            return checkpointer
+            cfg = config if config is not None else Config()
+            min_size = int(cfg.get("HITL_PG_POOL_MIN_SIZE", 1))
+            max_size = int(cfg.get("HITL_PG_POOL_MAX_SIZE", 2))
+            async_commit = bool(cfg.get("HITL_PG_ASYNC_COMMIT", False))
+            with _POSTGRES_SAVERS_LOCK:
+                # Re-check under the lock: a concurrent creator may have won.
+                saver = _POSTGRES_SAVERS.get(key)
+                if saver is None:
+                    hitl_logger.info("Creating pooled AsyncPostgresSaver checkpointer", extra={
+                            "checkpointer_type": "postgres",
+                            "has_uri": bool(db_uri),
+                            "auto_setup": auto_setup,
+                            "pool_min_size": min_size,
+                            "pool_max_size": max_size,
+                            "async_commit": async_commit,
+                        }
+                    )
+                    saver = _POSTGRES_SAVERS[key] = PooledAsyncPostgresSaver(
+                        db_uri,
+                        min_size=min_size,
+                        max_size=max_size,
+                        auto_setup=auto_setup,
+                        async_commit=async_commit,
+                    )
+            return saver
             
         except Exception as e:
             hitl_logger.error(f"Failed to create PostgreSQL checkpointer: {e}", extra={
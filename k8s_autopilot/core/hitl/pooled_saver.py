@@ -0,0 +1,104 @@
+"""
+Pooled async PostgreSQL checkpointer for HITL.
+
+``AsyncPostgresSaver`` must normally be constructed inside a running event
+loop and set up explicitly by the caller.  The supervisor builds its
+checkpointer during the server's synchronous startup (before uvicorn starts
+the loop), so this subclass defers both: the connection pool is opened and
+``setup()`` runs on the first async checkpoint operation.
+
+Requires the optional ``langgraph-checkpoint-postgres`` / ``psycopg-pool``
+packages; ``checkpointer.py`` imports it behind an ``ImportError`` guard.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg import AsyncConnection, AsyncCursor, Capabilities
+from psycopg.rows import DictRow, dict_row
+from psycopg_pool import AsyncConnectionPool
+
+
+async def _disable_synchronous_commit(conn: AsyncConnection) -> None:
+    """Pool ``configure`` hook: session-level asynchronous commit."""
+    await conn.execute("SET synchronous_commit TO OFF")
+
+
+class PooledAsyncPostgresSaver(AsyncPostgresSaver):
+    """``AsyncPostgresSaver`` over an ``AsyncConnectionPool``, opened lazily.
+
+    ``AsyncPostgresSaver._cursor`` runs every operation under ``self.lock``,
+    so checkpoint operations are serialized and at most one pooled
+    connection is in use at a time.  The pool buys reconnection on a broken
+    connection and deferred opening, not concurrency; keep it small.
+
+    Args:
+        db_uri: PostgreSQL connection string.
+        min_size: Connections kept open once the pool is started.
+        max_size: Upper bound on pooled connections (1–2 is enough; see above).
+        auto_setup: Run ``setup()`` (tables + migrations) on first use.
+        async_commit: Open sessions with ``synchronous_commit = off`` so
+            checkpoint commits return without waiting for the WAL flush.
+            A crash can lose the last few hundred milliseconds of
+            checkpoints; the database itself stays consistent.
+    """
+
+    def __init__(
+        self,
+        db_uri: str,
+        *,
+        min_size: int = 1,
+        max_size: int = 2,
+        auto_setup: bool = True,
+        async_commit: bool = False,
+    ) -> None:
+        # Mirrors AsyncPostgresSaver.__init__ without capturing the running
+        # loop, which does not exist yet at startup.  ``loop`` is only used by
+        # the sync bridge methods and is bound when the pool is opened.
+        BaseCheckpointSaver.__init__(self)
+        self.conn = AsyncConnectionPool(
+            db_uri,
+            min_size=min_size,
+            max_size=max_size,
+            open=False,
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+            configure=_disable_synchronous_commit if async_commit else None,
+        )
+        self.pipe = None
+        self.lock = asyncio.Lock()
+        self.loop = None  # type: ignore[assignment]
+        self.supports_pipeline = Capabilities().has_pipeline()
+        self._auto_setup = auto_setup
+        self._ready = False
+        self._open_lock = asyncio.Lock()
+
+    async def _open(self) -> None:
+        """Open the pool and run ``setup()`` exactly once."""
+        async with self._open_lock:
+            if self._ready:
+                return
+            self.loop = asyncio.get_running_loop()
+            await self.conn.open(wait=True)
+            # setup() goes through _cursor() too, so mark ready first.
+            self._ready = True
+            if self._auto_setup:
+                try:
+                    await self.setup()
+                except BaseException:
+                    self._ready = False
+                    raise
+
+    @asynccontextmanager
+    async def _cursor(self, *, pipeline: bool = False) -> AsyncIterator[AsyncCursor[DictRow]]:
+        if not self._ready:
+            await self._open()
+        async with super()._cursor(pipeline=pipeline) as cur:
+            yield cur
+
+    async def aclose(self) -> None:
+        """Close the connection pool (graceful shutdown)."""
+        self._ready = False
+        await self.conn.close()
@@ -5,7 +5,7 @@ from operator import add
 from enum import Enum
 
 from datetime import datetime, timezone
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from langchain_core.messages import BaseMessage, AnyMessage
 from langgraph.graph.message import add_messages
 
@@ -123,6 +123,9 @@ class SecurityScanReport(BaseModel):
 
 class ApprovalStatus(BaseModel):
     """Human approval status"""
+    # Not on any request path; build the validator on first use, not at import.
+    model_config = ConfigDict(defer_build=True)
+
     status: Literal["pending", "approved", "rejected", "modified"]
     reviewer: Optional[str] = None
     comments: Optional[str] = None
@@ -287,6 +290,8 @@ class SupervisorWorkflowState(BaseModel):
     
     Reference: aws-orchestrator SupervisorWorkflowState pattern.
     """
+    # Built on the first conversation rather than at import (cold start).
+    model_config = ConfigDict(defer_build=True)
     
     # Current workflow phase (set by supervisor router)
     current_phase: Optional[str] = Field(
@@ -180,6 +180,21 @@ def main(host: str, port: int, agent_card: str, config_file: str):
 
         @contextlib.asynccontextmanager
         async def lifespan(app):
+            # Build all coordinator deep agent graphs concurrently up front
+            # instead of serially on each coordinator's first request.
+            # Bounded so a hanging MCP server cannot block startup.  On timeout
+            # the builds keep running in the background (shielded, not
+            # cancelled); a request for an unfinished coordinator joins its
+            # in-flight build instead of starting another.
+            prebuild_timeout = float(config.get("SUPERVISOR_PREBUILD_TIMEOUT", 60.0))
+            prebuild = asyncio.ensure_future(supervisor_agent.initialize())
+            try:
+                await asyncio.wait_for(asyncio.shield(prebuild), timeout=prebuild_timeout)
+            except asyncio.TimeoutError:
+                server_logger.warning(
+                    "Coordinator pre-build still running after timeout — continuing in background",
+                    extra={"timeout_s": prebuild_timeout},
+                )
             yield
             # On shutdown, uvicorn cancels all tasks. The a2a EventQueueSource catches
             # CancelledError in __aexit__ and deadlocks waiting for task_done().
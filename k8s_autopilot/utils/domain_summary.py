@@ -1,5 +1,12 @@
+import re
 from typing import Any, Dict, Optional
 
+# Case-insensitive single-pass scans over the coordinator's final message
+# (replaces repeated ``msg.lower()`` copies + substring checks).
+_HANDOFF_RE = re.compile(r"outside my scope", re.IGNORECASE)
+_SERVICE_CONTEXT_RE = re.compile(r"service|namespace", re.IGNORECASE)
+
+
 def extract_domain_summary(
     domain: str,
     final_message: Optional[str],
@@ -36,7 +43,7 @@ def extract_domain_summary(
     else:
         msg = msg_raw
 
-    is_handoff = "outside my scope" in msg.lower()
+    is_handoff = _HANDOFF_RE.search(msg) is not None
 
     summary: Dict[str, Any] = {
         "domain": domain,
@@ -46,7 +53,7 @@ def extract_domain_summary(
 
     # Extract service names mentioned in common patterns
     # (lightweight heuristic — coordinator should write /shared/ for full detail)
-    if "service" in msg.lower() or "namespace" in msg.lower():
+    if _SERVICE_CONTEXT_RE.search(msg):
         summary["has_service_context"] = True
 
     return summary
@@ -23,6 +23,7 @@ Architecture reference:
     - §Non-negotiable: cross-domain transfers use structured envelopes
 """
 
+import logging
 from typing import Annotated, Any
 from langchain.tools import tool, InjectedToolCallId, ToolRuntime
 from langchain_core.messages import ToolMessage
@@ -64,13 +65,14 @@ def create_escalate_to_supervisor_tool():
             user_request: The user's exact request that is outside your scope.
             reason: Brief explanation of why this request is outside your scope.
         """
-        logger.info(
-            "Escalation to supervisor requested",
-            extra={
-                "user_request_preview": user_request[:200],
-                "reason": reason[:200],
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Escalation to supervisor requested",
+                extra={
+                    "user_request_preview": user_request[:200],
+                    "reason": reason[:200],
+                },
+            )
 
         return Command(
             goto="__end__",
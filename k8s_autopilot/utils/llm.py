@@ -25,7 +25,8 @@ def create_model(llm_config: Dict[str, Any]) -> BaseChatModel:
     Returns:
         A ready-to-use ``BaseChatModel`` instance.
     """
-    kwargs = {k: v for k, v in llm_config.items() if k != "provider"}
+    kwargs = dict(llm_config)
+    kwargs.pop("provider", None)
     return init_chat_model(**kwargs)
 
 
@@ -18,15 +18,26 @@ Usage::
 """
 
 
+import atexit
 import json
 import logging
+import queue
 import sys
 from datetime import datetime, timezone
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Callable, Dict, Optional
 
 from colorama import Fore, Style
 
+# Optional fast JSON encoder for structured logs
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 
 # ---------------------------------------------------------------------------
 # Color palettes
@@ -68,6 +79,11 @@ def _cfg(key: str, fallback: Any) -> Any:
     return getattr(cfg, key, fallback)
 
 
+def _level_from_name(name: str) -> int:
+    """Map a legacy level name (``"INFO"``) to its ``logging`` int."""
+    return getattr(logging, name.upper(), logging.INFO)
+
+
 # ---------------------------------------------------------------------------
 # Colored console formatter (for StreamHandler)
 # ---------------------------------------------------------------------------
@@ -95,7 +111,7 @@ class _ColorFormatter(logging.Formatter):
         except KeyError:
             lc = Fore.WHITE
 
-        ts = datetime.now(timezone.utc).strftime(self._date_fmt)
+        ts = datetime.fromtimestamp(record.created, timezone.utc).strftime(self._date_fmt)
         msg = record.getMessage()
 
         extras = getattr(record, "_structured_extra", None)
@@ -116,12 +132,36 @@ class _ColorFormatter(logging.Formatter):
 # Structured (JSON) formatter (for both file and console when enabled)
 # ---------------------------------------------------------------------------
 
+def _json_default(obj: Any) -> str:
+    """Fallback encoder: ISO-8601 for datetimes, ``str()`` for the rest."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps_json(entry: dict[str, Any]) -> str:
+    """Serialize a log entry, using ``orjson`` when it is installed.
+
+    ``orjson`` encodes datetimes natively and runs several times faster
+    than the stdlib encoder; anything it rejects (e.g. ints wider than
+    64 bits) falls back to ``json.dumps``.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                entry, default=_json_default, option=orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(entry, default=_json_default)
+
+
 class _JsonFormatter(logging.Formatter):
     """Emits each log record as a single JSON line (structured logging)."""
 
     def format(self, record: logging.LogRecord) -> str:
         entry: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "agent": getattr(record, "agent_name", None),
             "message": record.getMessage(),
@@ -130,7 +170,7 @@ class _JsonFormatter(logging.Formatter):
         extras = getattr(record, "_structured_extra", None)
         if extras:
             entry.update(extras)
-        return json.dumps(entry, default=str)
+        return _dumps_json(entry)
 
 
 # ---------------------------------------------------------------------------
@@ -172,12 +212,100 @@ class _PlainFormatter(logging.Formatter):
 _initialised_loggers: set[str] = set()
 
 
+def _build_sink_handlers(level: int) -> list[logging.Handler]:
+    """Create the configured console + file handlers at ``level``."""
+    structured: bool = _cfg("LOG_STRUCTURED_JSON", False)
+    handlers: list[logging.Handler] = []
+
+    # ── Console handler ──
+    if _cfg("LOG_TO_CONSOLE", True):
+        console = logging.StreamHandler(sys.stderr)
+        console.setLevel(level)
+        console.setFormatter(_JsonFormatter() if structured else _ColorFormatter())
+        handlers.append(console)
+
+    # ── File handler ──
+    if _cfg("LOG_TO_FILE", True):
+        log_file: str = _cfg("LOG_FILE", "k8s_autopilot.log")
+        fh = logging.FileHandler(log_file, encoding="utf-8")
+        fh.setLevel(level)
+        fh.setFormatter(_JsonFormatter() if structured else _PlainFormatter())
+        handlers.append(fh)
+
+    return handlers
+
+
+# ---------------------------------------------------------------------------
+# Queued sink (formatting + I/O on a background thread)
+# ---------------------------------------------------------------------------
+
+class _PassthroughQueueHandler(QueueHandler):
+    """
+    Enqueue records without formatting them.
+
+    The stdlib ``prepare()`` runs the full formatter on the calling thread,
+    which is exactly the work the queue is meant to move off the hot path
+    (and would bake one sink's format into the message the others see).
+    Only the caller-owned state is snapshotted here: %-style ``args`` are
+    merged into the message and container values in the structured extras
+    are shallow-copied, so a caller mutating them after the log call cannot
+    race the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        extra = getattr(record, "_structured_extra", None)
+        if extra:
+            record._structured_extra = {  # type: ignore[attr-defined]
+                k: v.copy() if isinstance(v, (dict, list, set)) else v
+                for k, v in extra.items()
+            }
+        return record
+
+
+_queue_handler: Optional[QueueHandler] = None
+_queue_listener: Optional[QueueListener] = None
+
+
+def _get_queue_handler() -> Optional[QueueHandler]:
+    """
+    Return the process-wide queue handler, starting its listener once.
+
+    All agent loggers share one set of sink handlers behind a single
+    ``QueueListener`` thread; returns None when no sink is configured.
+    The shared sinks accept every level — each logger's own level does the
+    filtering, so loggers configured after the first one lose nothing.
+    """
+    global _queue_handler, _queue_listener
+    if _queue_handler is None:
+        sinks = _build_sink_handlers(logging.NOTSET)
+        if not sinks:
+            return None
+        log_queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        _queue_handler = _PassthroughQueueHandler(log_queue)
+        _queue_listener = QueueListener(log_queue, *sinks, respect_handler_level=True)
+        _queue_listener.start()
+        atexit.register(_stop_queue_listener)
+    return _queue_handler
+
+
+def _stop_queue_listener() -> None:
+    """Drain pending records and stop the listener thread (runs at exit)."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def _ensure_handlers(py_logger: logging.Logger, agent_name: str) -> None:
     """
     Attach console + file handlers exactly once per logger name.
 
     Prevents the duplicate-handler bug that occurred when multiple
-    ``AgentLogger("X")`` instances were created.
+    ``AgentLogger("X")`` instances were created.  With ``LOG_QUEUE_HANDLER``
+    enabled the logger only gets the shared queue handler and the sinks
+    run on the listener thread.
     """
     if py_logger.name in _initialised_loggers:
         return
@@ -189,22 +317,14 @@ def _ensure_handlers(py_logger: logging.Logger, agent_name: str) -> None:
     level_name: str = _cfg("LOG_LEVEL", "INFO")
     py_logger.setLevel(getattr(logging, level_name, logging.INFO))
 
-    structured: bool = _cfg("LOG_STRUCTURED_JSON", False)
-
-    # ── Console handler ──
-    if _cfg("LOG_TO_CONSOLE", True):
-        console = logging.StreamHandler(sys.stderr)
-        console.setLevel(py_logger.level)
-        console.setFormatter(_JsonFormatter() if structured else _ColorFormatter())
-        py_logger.addHandler(console)
+    if _cfg("LOG_QUEUE_HANDLER", False):
+        qh = _get_queue_handler()
+        if qh is not None:
+            py_logger.addHandler(qh)
+        return
 
-    # ── File handler ──
-    if _cfg("LOG_TO_FILE", True):
-        log_file: str = _cfg("LOG_FILE", "k8s_autopilot.log")
-        fh = logging.FileHandler(log_file, encoding="utf-8")
-        fh.setLevel(py_logger.level)
-        fh.setFormatter(_JsonFormatter() if structured else _PlainFormatter())
-        py_logger.addHandler(fh)
+    for handler in _build_sink_handlers(py_logger.level):
+        py_logger.addHandler(handler)
 
 
 # ---------------------------------------------------------------------------
@@ -234,26 +354,34 @@ class AgentLogger:
 
         _ensure_handlers(self._logger, agent_name)
 
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 — mirrors logging.Logger
+        """Return True if a record at ``level`` would be emitted.
+
+        Use it to skip building expensive ``extra`` payloads for records
+        that the configured level would drop anyway.
+        """
+        return self._logger.isEnabledFor(level)
+
     # ── Convenience level methods (sync — suitable for most call-sites) ──
 
-    def debug(self, msg: str, **kwargs: Any) -> None:
-        self._emit(logging.DEBUG, msg, **kwargs)
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._emit(logging.DEBUG, msg, *args, **kwargs)
 
-    def info(self, msg: str, **kwargs: Any) -> None:
-        self._emit(logging.INFO, msg, **kwargs)
+    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._emit(logging.INFO, msg, *args, **kwargs)
 
-    def warning(self, msg: str, **kwargs: Any) -> None:
-        self._emit(logging.WARNING, msg, **kwargs)
+    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._emit(logging.WARNING, msg, *args, **kwargs)
 
-    def error(self, msg: str, **kwargs: Any) -> None:
-        self._emit(logging.ERROR, msg, **kwargs)
+    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._emit(logging.ERROR, msg, *args, **kwargs)
 
-    def exception(self, msg: str, **kwargs: Any) -> None:
+    def exception(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log at ERROR level with exc_info attached (like stdlib)."""
-        self._emit(logging.ERROR, msg, **kwargs)
+        self._emit(logging.ERROR, msg, *args, **kwargs)
 
-    def critical(self, msg: str, **kwargs: Any) -> None:
-        self._emit(logging.CRITICAL, msg, **kwargs)
+    def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._emit(logging.CRITICAL, msg, *args, **kwargs)
 
     # ── Core emit (unified path for ALL log output) ──────────────────────
 
@@ -261,19 +389,43 @@ class AgentLogger:
         self,
         level: int,
         message: str,
-        *,
+        *args: Any,
         task_id: Optional[str] = None,
         context_id: Optional[str] = None,
         extra: Optional[dict[str, Any]] = None,
     ) -> None:
-        """Single code-path that feeds console, file, and websocket."""
+        """
+        Single code-path that feeds console, file, and websocket.
+
+        ``args`` are %-style arguments for ``message``, as in stdlib logging:
+        they are only interpolated once a handler accepts the record, so
+        filtered-out calls never pay for string formatting.
+        """
+        if not self._logger.isEnabledFor(level):
+            return
+        record = self._make_record(
+            level, message, args, task_id=task_id, context_id=context_id, extra=extra,
+        )
+        self._logger.handle(record)
+
+    def _make_record(
+        self,
+        level: int,
+        message: str,
+        args: tuple[Any, ...] = (),
+        *,
+        task_id: Optional[str] = None,
+        context_id: Optional[str] = None,
+        extra: Optional[dict[str, Any]] = None,
+    ) -> logging.LogRecord:
+        """Build a LogRecord carrying agent identity + structured extras."""
         record = self._logger.makeRecord(
             name=self._logger.name,
             level=level,
             fn="",
             lno=0,
             msg=message,
-            args=(),
+            args=args,
             exc_info=None,
         )
         # Attach agent identity + structured extras to the record
@@ -286,14 +438,13 @@ class AgentLogger:
         if extra:
             structured_extra.update(extra)
         record._structured_extra = structured_extra  # type: ignore[attr-defined]
-
-        self._logger.handle(record)
+        return record
 
     # ── Backward-compat: log_structured() ────────────────────────────────
 
     def log_structured(
         self,
-        level: str = "INFO",
+        level: int | str = logging.INFO,
         message: str = "",
         task_id: Optional[str] = None,
         context_id: Optional[str] = None,
@@ -302,9 +453,11 @@ class AgentLogger:
         """
         Backward-compatible structured log call.
 
+        ``level`` should be a ``logging`` int constant; legacy level names
+        (``"INFO"``) are still accepted but pay a name lookup per call.
         Prefer ``log.info(...)``, ``log.error(...)`` etc. for new code.
         """
-        py_level = getattr(logging, level.upper(), logging.INFO)
+        py_level = level if isinstance(level, int) else _level_from_name(level)
         self._emit(py_level, message, task_id=task_id, context_id=context_id, extra=extra)
 
     # ── Async log (for websocket streaming) ──────────────────────────────
@@ -312,11 +465,11 @@ class AgentLogger:
     async def alog(
         self,
         message: str,
-        level: str = "INFO",
+        level: int | str = logging.INFO,
         **kwargs: Any,
     ) -> None:
         """Async variant that also pushes to websocket if configured."""
-        py_level = getattr(logging, level.upper(), logging.INFO)
+        py_level = level if isinstance(level, int) else _level_from_name(level)
         self._emit(py_level, message, **kwargs)
 
         # Websocket push (fire-and-forget)
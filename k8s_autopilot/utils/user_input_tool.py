@@ -25,6 +25,7 @@ Follows the established HITL pattern from:
 """
 
 import json
+import logging
 from typing import Any, Dict, List, Optional
 
 from langchain.tools import tool, ToolRuntime
@@ -210,13 +211,16 @@ def create_user_input_tool():
             else str(human_response)
         )
 
-        logger.info(
-            "User responded",
-            extra={
-                "response_type": type(human_response).__name__,
-                "response_preview": str(human_response)[:200],
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "User responded",
+                extra={
+                    "response_type": type(human_response).__name__,
+                    # Slice the text already built for the ToolMessage rather
+                    # than stringifying the whole response a second time.
+                    "response_preview": human_response_str[:200],
+                },
+            )
 
         return Command(update={
             "messages": [
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+
+import k8s_autopilot.core.agents.supervisor_agent as supervisor_module
+from k8s_autopilot.core.agents.types import BaseDeepAgent
+
+
+class StubCoordinator(BaseDeepAgent):
+    """Minimal BaseDeepAgent whose build_agent() returns a sentinel graph."""
+
+    def __init__(self, name: str, *, fail: bool = False, build_delay: float = 0.0):
+        super().__init__()
+        self._name = name
+        self._fail = fail
+        self._build_delay = build_delay
+        self.build_calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def system_prompt(self) -> str:
+        return "stub"
+
+    @property
+    def context_schema(self) -> type:
+        return dict
+
+    def get_model(self):
+        return None
+
+    async def get_subagent_specs(self):
+        return []
+
+    def make_backend(self):
+        return None
+
+    def build_store(self):
+        return None
+
+    def build_checkpointer(self):
+        return None
+
+    async def build_agent(self):
+        self.build_calls += 1
+        await asyncio.sleep(self._build_delay)
+        if self._fail:
+            raise RuntimeError("build failed")
+        return f"graph:{self._name}"
+
+    def seed_files(self, skills_dir=None, memory_dir=None):
+        return {}
+
+
+COORDINATOR_NAMES = (
+    "helm-operator-coordinator",
+    "k8s-operator-coordinator",
+    "app-operator-coordinator",
+    "observability-coordinator",
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_supervisor_model(monkeypatch):
+    """Keep supervisor construction offline."""
+    monkeypatch.setattr(
+        supervisor_module,
+        "create_model",
+        lambda _cfg: FakeMessagesListChatModel(responses=[AIMessage(content="ok")]),
+    )
+
+
+@pytest.fixture
+def coordinators():
+    return [StubCoordinator(n) for n in COORDINATOR_NAMES]
+
+
+@pytest.fixture
+def supervisor(coordinators):
+    return supervisor_module.create_k8sAutopilotSupervisorAgent(coordinators=coordinators)
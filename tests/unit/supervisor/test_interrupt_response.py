@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from k8s_autopilot.core.agents.supervisor_agent import k8sAutopilotSupervisorAgent
+
+build = k8sAutopilotSupervisorAgent._build_interrupt_response
+
+
+def _interrupt(value):
+    return (SimpleNamespace(value=value),)
+
+
+def test_feedback_request_takes_precedence_over_action_requests():
+    value = {
+        "pending_feedback_requests": {"question": "Which namespace?"},
+        "action_requests": [{"name": "helm_install", "args": {}}],
+    }
+
+    resp = build(_interrupt(value), "ctx", "task")
+
+    assert resp.metadata["interrupt_type"] == "human_feedback"
+    assert resp.content["question"] == "Which namespace?"
+
+
+def test_non_dict_feedback_falls_through_to_approval():
+    value = {
+        "pending_feedback_requests": "not-a-dict",
+        "action_requests": [{"name": "helm_install", "args": {}}],
+    }
+
+    resp = build(_interrupt(value), "ctx", "task")
+
+    assert resp.metadata["interrupt_type"] == "hitl_approval"
+    assert resp.metadata["action_request_count"] == 1
+
+
+def test_custom_and_generic_interrupts():
+    custom = build(_interrupt({"type": "plan_review", "summary": "s"}), "ctx", "task")
+    generic = build(_interrupt("plain text"), "ctx", "task")
+
+    assert custom.metadata["interrupt_type"] == "plan_review"
+    assert generic.metadata["interrupt_type"] == "generic"
+    assert generic.content["data"] == {"type": "generic", "data": "plain text"}
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import pytest
+
+from k8s_autopilot.core.agents.supervisor_agent import create_k8sAutopilotSupervisorAgent
+
+from .conftest import COORDINATOR_NAMES, StubCoordinator
+
+
+async def test_initialize_builds_coordinators_concurrently():
+    coords = [StubCoordinator(n, build_delay=0.2) for n in COORDINATOR_NAMES]
+    supervisor = create_k8sAutopilotSupervisorAgent(coordinators=coords)
+
+    start = time.monotonic()
+    await supervisor.initialize()
+    elapsed = time.monotonic() - start
+
+    assert all(c.is_initialized for c in coords)
+    assert elapsed < 0.2 * len(coords)
+
+
+async def test_initialize_leaves_failed_coordinator_for_lazy_retry():
+    coords = [StubCoordinator(n, fail=(n == "k8s-operator-coordinator")) for n in COORDINATOR_NAMES]
+    supervisor = create_k8sAutopilotSupervisorAgent(coordinators=coords)
+
+    await supervisor.initialize()
+
+    status = {c.name: c.is_initialized for c in coords}
+    assert status["k8s-operator-coordinator"] is False
+    assert status["helm-operator-coordinator"] is True
+
+
+async def test_concurrent_builds_share_one_task():
+    coord = StubCoordinator("helm-operator-coordinator", build_delay=0.1)
+
+    waiter = asyncio.ensure_future(coord.ensure_graph())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    graphs = await asyncio.gather(coord.ensure_graph(), coord.ensure_graph())
+
+    assert graphs == ["graph:helm-operator-coordinator"] * 2
+    assert coord.build_calls == 1
+    assert coord.is_initialized
+
+
+async def test_initialize_skips_already_built_coordinators(supervisor, coordinators):
+    await supervisor.initialize()
+    await supervisor.initialize()
+
+    assert [c.build_calls for c in coordinators] == [1, 1, 1, 1]
+
+
+@pytest.mark.parametrize(
+    ("custom_config", "expected"),
+    [(None, "async"), ({"SUPERVISOR_CHECKPOINT_MODE": "phase"}, "exit")],
+)
+async def test_stream_passes_checkpoint_durability(coordinators, custom_config, expected):
+    supervisor = create_k8sAutopilotSupervisorAgent(
+        coordinators=coordinators, custom_config=custom_config,
+    )
+    seen = {}
+
+    class RecordingGraph:
+        async def astream(self, *_args, **kwargs):
+            seen.update(kwargs)
+            return
+            yield
+
+    supervisor._graph = RecordingGraph()
+    async for _ in supervisor._run_stream({}, {"configurable": {"thread_id": "ctx"}}, "ctx", "task"):
+        pass
+
+    assert seen["durability"] == expected